@@ -89,8 +89,4 @@ def colo_view(self: ColoTensor, *shape) -> 'ColoTensor':
 
 @colo_op_impl(torch.Tensor.size)
 def colo_size(self: ColoTensor, dim: Optional[int] = None) -> Union[torch.Size, int]:
-    size = self.size_global()
-    if dim is None:
-        return size
-    else:
-        return size[dim]
+    return self.size_global(dim)
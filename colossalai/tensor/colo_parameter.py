@@ -2,29 +2,28 @@ from typing import Optional
 
 import torch
 
-from colossalai.tensor.colo_tensor import ColoTensor
+from colossalai.tensor.colo_tensor import _EMPTY_DATA, ColoTensor
 from colossalai.tensor.const import TensorType
 from colossalai.tensor.param_op_hook import ColoParamOpHookManager
 from colossalai.tensor.tensor_spec import ColoTensorSpec
 
 
-def filter_colo_parameters(*args, **kwargs):
-    param_list = []
+def _get_colo_parameters(element, param_list: list) -> None:
+    if isinstance(element, list) or isinstance(element, tuple):
+        for e in element:
+            _get_colo_parameters(e, param_list)
+    elif isinstance(element, dict):
+        raise RuntimeError("Found Dict: ColoParameter can't deal with complicated arguments.")
+    elif isinstance(element, ColoParameter):
+        param_list.append(element)
 
-    def get_colo_parameters(element) -> None:
-        if isinstance(element, list) or isinstance(element, tuple):
-            for e in element:
-                get_colo_parameters(e)
-        elif isinstance(element, dict):
-            raise RuntimeError("Found Dict: ColoParameter can't deal with complicated arguments.")
-        elif isinstance(element, ColoParameter):
-            param_list.append(element)
-        return
 
+def filter_colo_parameters(*args, **kwargs):
+    param_list = []
     for a in args:
-        get_colo_parameters(a)
+        _get_colo_parameters(a, param_list)
     for v in kwargs.values():
-        get_colo_parameters(v)
+        _get_colo_parameters(v, param_list)
 
     return param_list
 
@@ -40,13 +39,14 @@ class ColoParameter(ColoTensor, torch.nn.Parameter):
     r"""A kind of ColoTensor to be considered as a module parameter.
 
     """
+    _type = TensorType.MODEL
 
     def __new__(cls,
                 data: Optional[torch.Tensor] = None,
                 requires_grad: bool = True,
                 spec: ColoTensorSpec = None) -> 'ColoParameter':
         if data is None:
-            data = torch.empty(0)
+            data = _EMPTY_DATA
         return torch.Tensor._make_subclass(cls, data, requires_grad)
 
     def __init__(self,
@@ -54,7 +54,6 @@ class ColoParameter(ColoTensor, torch.nn.Parameter):
                  requires_grad: bool = True,
                  spec: ColoTensorSpec = None) -> None:
         ColoTensor.__init__(self, data, spec)
-        self._type = TensorType.MODEL
         # a list contains modules sharing this ColoParameter with others.
         self._shared_param_modules = []
 
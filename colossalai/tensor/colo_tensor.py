@@ -1,11 +1,12 @@
 import operator
+from contextlib import contextmanager
 from copy import copy
-from functools import lru_cache, reduce
-from typing import Callable, Optional, Set
+from functools import reduce
+from typing import Callable, FrozenSet, List, Optional
 
 import torch
 
-from colossalai.tensor.dist_spec_mgr import DistSpecManager
+from colossalai.tensor.dist_spec_mgr import AsyncGatherHandle, DistSpecManager
 from colossalai.tensor.distspec import DistPlacementPattern, ReplicaSpec, _DistSpec
 from colossalai.tensor.process_group import ProcessGroup
 from colossalai.tensor.tensor_spec import ColoTensorSpec
@@ -13,27 +14,40 @@ from colossalai.tensor.tensor_spec import ColoTensorSpec
 from .const import TensorType
 from .op_wrapper import _COLOSSAL_OPS
 
-
-@lru_cache(None)
-def _get_my_nowrap_functions() -> Set[Callable]:
-    Tensor = torch.Tensor
-    return {
-        Tensor._base.__get__,
-        Tensor.grad.__get__,
-        Tensor._grad.__get__,
-        Tensor.data.__get__,    # make .data returns torch.Tensor rather than ColoTensor
-    }
+# shared zero-element payload for tensors constructed without data
+_EMPTY_DATA = torch.empty(0)
+# the outputs of these functions are not wrapped by `ColoTensor.__torch_function__`
+_NOWRAP_FUNCTIONS: FrozenSet[Callable] = frozenset({
+    torch.Tensor._base.__get__,
+    torch.Tensor.grad.__get__,
+    torch.Tensor._grad.__get__,
+    torch.Tensor.data.__get__,    # make .data returns torch.Tensor rather than ColoTensor
+})
 
 
 def _convert_output(output, colo_spec: ColoTensorSpec):
-    if type(output) == torch.Tensor:
-        return ColoTensor.from_torch_tensor(output, colo_spec)
+    if type(output) is torch.Tensor:
+        return ColoTensor._from_op_output(output, colo_spec)
     elif isinstance(output, (list, tuple)):
         return type(output)(_convert_output(o, colo_spec) for o in output)
     else:
         return output
 
 
+def _has_distributed_args(args, kwargs) -> bool:
+    for elem in args:
+        if isinstance(elem, ColoTensor):
+            if elem.is_sharded() or elem.has_compute_spec():
+                return True
+        elif isinstance(elem, (list, tuple)):
+            if _has_distributed_args(elem, {}):
+                return True
+    for v in kwargs.values():
+        if isinstance(v, ColoTensor) and (v.is_sharded() or v.has_compute_spec()):
+            return True
+    return False
+
+
 def _get_spec_from_args(args, kwargs) -> ColoTensorSpec:
     for elem in args:
         if isinstance(elem, ColoTensor):
@@ -72,6 +86,12 @@ class ColoTensor(torch.Tensor):
     """
     torch_major = int(torch.__version__.split('.')[0])
     torch_minor = int(torch.__version__.split('.')[1])
+    # the version check is constant, so it is evaluated once rather than on every dispatched op
+    _capture_backward = torch_major > 1 or (torch_major == 1 and torch_minor >= 12)
+    # tensor type is fixed per class, so keep it out of the per-instance __dict__
+    _type = TensorType.NONMODEL
+    # set by `bypass_unsharded_outputs()`
+    _bypass_unsharded_outputs: bool = False
 
     def __new__(cls, data: torch.Tensor, spec: ColoTensorSpec) -> 'ColoTensor':
         """
@@ -85,7 +105,7 @@ class ColoTensor(torch.Tensor):
             ColoTensor: a ColoTensor wrappers the data.
         """
         if data is None:
-            data = torch.empty(0)
+            data = _EMPTY_DATA
         return torch.Tensor._make_subclass(cls, data, data.requires_grad)
 
     def __init__(self, data: torch.Tensor, spec: Optional[ColoTensorSpec] = None) -> None:
@@ -104,13 +124,11 @@ class ColoTensor(torch.Tensor):
             else:
                 self.process_group = spec.pg
 
-        self._type = TensorType.NONMODEL
-
     def has_compute_spec(self) -> bool:
         return self.compute_spec is not None
 
     def is_model_data(self) -> bool:
-        return self._type == TensorType.MODEL
+        return self._type is TensorType.MODEL
 
     def get_process_group(self) -> 'ProcessGroup':
         return self.process_group
@@ -179,7 +197,7 @@ class ColoTensor(torch.Tensor):
         if func in _COLOSSAL_OPS:
             func = _COLOSSAL_OPS[func]
 
-        if cls.torch_major > 1 or (cls.torch_major == 1 and cls.torch_minor >= 12):
+        if cls._capture_backward:
             # in order to trigger pre-op hook in the forward of checkpoint module
             # we have to capture the `backward` function
             # and make sure that it does not in `torch._C.DisableTorchFunction()` context
@@ -190,12 +208,38 @@ class ColoTensor(torch.Tensor):
                 return backward_tensor.backward(**tensor_kwargs)
 
         with torch._C.DisableTorchFunction():
-            ret = func(*args, **kwargs)
-            if func in _get_my_nowrap_functions():
+            # most ops have no keyword arguments, skip unpacking them into a new dict
+            ret = func(*args, **kwargs) if kwargs else func(*args)
+            if func in _NOWRAP_FUNCTIONS:
                 return ret
-            else:
-                colo_spec = _get_spec_from_args(args, kwargs)
-                return _convert_output(ret, colo_spec)
+            if ColoTensor._bypass_unsharded_outputs and not _has_distributed_args(args, kwargs):
+                return ret
+            # only look up the spec when there is a tensor to wrap,
+            # since many ops return a size, a dtype or a bool
+            if type(ret) is torch.Tensor:
+                return ColoTensor._from_op_output(ret, _get_spec_from_args(args, kwargs))
+            elif isinstance(ret, (list, tuple)):
+                return _convert_output(ret, _get_spec_from_args(args, kwargs))
+            return ret
+
+    @staticmethod
+    @contextmanager
+    def bypass_unsharded_outputs():
+        """bypass_unsharded_outputs
+
+        A context in which ops whose ColoTensor arguments are neither sharded nor carry a compute spec
+        return plain torch tensors, so they do not pay for wrapping outputs that hold no distributed information.
+
+        Example:
+            >>> with ColoTensor.bypass_unsharded_outputs():
+            >>>     y = colo_t.abs()    # a torch.Tensor if colo_t is replicated
+        """
+        prev = ColoTensor._bypass_unsharded_outputs
+        try:
+            ColoTensor._bypass_unsharded_outputs = True
+            yield
+        finally:
+            ColoTensor._bypass_unsharded_outputs = prev
 
     def __repr__(self):
         output_list = [super(ColoTensor, self).__repr__()]
@@ -261,6 +305,70 @@ class ColoTensor(torch.Tensor):
         """
         return self.redistribute(ReplicaSpec())
 
+    def to_replicate_async_(self) -> AsyncGatherHandle:
+        """to_replicate_async_
+
+        an inline member function, launching the conversion of the dist spec to REPLICATE without waiting for it.
+        The payload and dist spec of the tensor are updated when `wait()` of the returned handle is called,
+        so the computation issued before that can overlap with the all-gather.
+        The tensor must not be used before `wait()`. Like `to_replicate_`, it does not handle backward propagation.
+
+        Returns:
+            AsyncGatherHandle: the handle of the all-gather.
+        """
+        assert self.is_sharded(), "to_replicate_async_ requires a sharded tensor"
+        assert self.grad_fn is None, "Current tensor has grad_fn and it can't get converted"
+
+        def _set_replicated(payload: torch.Tensor) -> None:
+            self.data = payload
+            self.dist_spec = ReplicaSpec()
+
+        return DistSpecManager._gather_async(self.data, self.dist_spec, self.process_group, _set_replicated)
+
+    @staticmethod
+    def to_replicate_bucketed_(tensors: List['ColoTensor'], bucket_size_mb: int = 25) -> None:
+        """to_replicate_bucketed_
+
+        an inline function, converting dist specs of a list of tensors to REPLICATE.
+        Sharded tensors sharing the same process group, dist spec, dtype and device are gathered
+        in buckets, with a single all-gather per bucket instead of one all-gather per tensor.
+        Like `to_replicate_`, it does not handle the logic of backward propagation.
+
+        Args:
+            tensors (List[ColoTensor]): the tensors to be replicated.
+            bucket_size_mb (int, optional): a bucket is gathered once its shards reach this size,
+                which bounds the extra memory held during the gather. Values <= 0 disable bucketing. Defaults to 25.
+        """
+        bucket_bytes = bucket_size_mb * 1024**2
+        # each open bucket is [key, tensors, bytes of the shards]
+        buckets = []
+        for tensor in tensors:
+            if not tensor.is_sharded():
+                continue
+            assert tensor.grad_fn is None, "Current tensor has grad_fn and it can't get converted"
+            key = (tensor.process_group, tensor.dist_spec, tensor.dtype, tensor.device)
+            for bucket in buckets:
+                if bucket[0] == key:
+                    break
+            else:
+                bucket = [key, [], 0]
+                buckets.append(bucket)
+            bucket[1].append(tensor)
+            bucket[2] += tensor.numel() * tensor.element_size()
+            if bucket[2] >= bucket_bytes:
+                ColoTensor._replicate_bucket_(bucket[1], key[0], key[1])
+                buckets.remove(bucket)
+
+        for key, bucket_tensors, _ in buckets:
+            ColoTensor._replicate_bucket_(bucket_tensors, key[0], key[1])
+
+    @staticmethod
+    def _replicate_bucket_(tensors: List['ColoTensor'], pg: ProcessGroup, dist_spec: _DistSpec) -> None:
+        payloads = DistSpecManager._gather_bucketed([t.data for t in tensors], dist_spec, pg)
+        for tensor, payload in zip(tensors, payloads):
+            tensor.data = payload
+            tensor.dist_spec = ReplicaSpec()
+
     @staticmethod
     def from_torch_tensor(tensor: torch.Tensor, spec: Optional[ColoTensorSpec] = None) -> 'ColoTensor':
         """from_torch_tensor
@@ -278,6 +386,23 @@ class ColoTensor(torch.Tensor):
         tensor.__init__(tensor, spec=spec)
         return tensor
 
+    @staticmethod
+    def _from_op_output(tensor: torch.Tensor, spec: Optional[ColoTensorSpec]) -> 'ColoTensor':
+        """_from_op_output
+
+        A fast `from_torch_tensor` for the outputs of ops dispatched by `__torch_function__`.
+        Their spec is taken from a ColoTensor argument and always carries a process group,
+        so the attributes are set directly instead of going through `__init__`.
+        """
+        if spec is None or spec.pg is None:
+            return ColoTensor.from_torch_tensor(tensor, spec)
+        tensor = tensor.as_subclass(ColoTensor)
+        tensor.has_initialized = True
+        tensor.dist_spec = spec.dist_attr
+        tensor.compute_spec = spec.compute_attr
+        tensor.process_group = spec.pg
+        return tensor
+
     def __deepcopy__(self, memo):
         if id(self) in memo:
             return memo[id(self)]
@@ -310,13 +435,19 @@ class ColoTensor(torch.Tensor):
         num_partitions = spec.num_partitions
         # import inspect
         # print(*['{:40}| {}:{}\n'.format(x.function, x.filename, x.lineno) for x in inspect.stack()])
-        size_list = list(self.size_local())
+        local_size = self.size_local()
+        if args != ():
+            # only scale the requested dimension instead of rebuilding the whole shape
+            ndim = len(local_size)
+            size = local_size[args[0]]
+            for dim, num_partition in zip(dims, num_partitions):
+                if dim % ndim == args[0] % ndim:
+                    size *= num_partition
+            return size
+        size_list = list(local_size)
         for dim, num_partition in zip(dims, num_partitions):
             size_list[dim] *= num_partition
-        if args == ():
-            return torch.Size(size_list)
-        else:
-            return size_list[args[0]]
+        return torch.Size(size_list)
 
     def numel_global(self):
         """Returns the number of elements in the tensor when it's replicated.
@@ -326,18 +457,18 @@ class ColoTensor(torch.Tensor):
     # Some API for dist spec check
 
     def is_replicate(self):
-        return self.dist_spec.placement == DistPlacementPattern.REPLICATE \
+        return self.dist_spec.placement is DistPlacementPattern.REPLICATE \
                or (len(self.dist_spec.num_partitions) == 1
                    and self.dist_spec.num_partitions[0] == 1) \
                or (self.process_group.tp_world_size() == 1)
 
     def is_shard_1dcol(self):
-        return self.dist_spec.placement == DistPlacementPattern.SHARD \
+        return self.dist_spec.placement is DistPlacementPattern.SHARD \
                and len(self.dist_spec.dims) == 1 and self.dist_spec.dims[0] == -1
 
     def is_shard_1drow(self):
-        return self.dist_spec.placement == DistPlacementPattern.SHARD \
+        return self.dist_spec.placement is DistPlacementPattern.SHARD \
                and len(self.dist_spec.dims) == 1 and self.dist_spec.dims[0] == 0
 
     def is_sharded(self):
-        return self.dist_spec.placement == DistPlacementPattern.SHARD
+        return self.dist_spec.placement is DistPlacementPattern.SHARD
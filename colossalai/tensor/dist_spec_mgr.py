@@ -1,9 +1,11 @@
+import operator
 from contextlib import contextmanager
+from functools import reduce
+from typing import Any, Callable, List, Optional, Tuple
 
 import torch
 import torch.distributed as dist
 # from colossalai.nn.layer.utils import divide
-from numpy import prod
 from packaging import version
 
 from colossalai.logging import get_dist_logger
@@ -29,6 +31,57 @@ def divide(numerator, denominator):
     return numerator // denominator
 
 
+class AsyncGatherHandle:
+    """AsyncGatherHandle
+    Returned by `DistSpecManager._gather_async`. The all-gather runs on the communication stream
+    until `wait()` is called, so that it can overlap with the computation issued in between.
+
+    Args:
+        work: the pytorch async work of the all-gather.
+        buffer (Optional[List[torch.Tensor]]): the buffers receiving the shards of all ranks, None if `merged` is set.
+        old_dist_spec (_DistSpec): the distributed spec. of the shards.
+        device (torch.device): the device the replicated tensor is returned on.
+        merged (Optional[torch.Tensor], optional): the replicated tensor, if the shards are gathered
+            straight into it and need no merging. Defaults to None.
+        callback (Optional[Callable[[torch.Tensor], None]], optional): called with the replicated tensor
+            when the gather is waited. Defaults to None.
+    """
+
+    def __init__(self,
+                 work,
+                 buffer: Optional[List[torch.Tensor]],
+                 old_dist_spec: _DistSpec,
+                 device: torch.device,
+                 merged: Optional[torch.Tensor] = None,
+                 callback: Optional[Callable[[torch.Tensor], None]] = None) -> None:
+        self._work = work
+        self._buffer = buffer
+        self._old_dist_spec = old_dist_spec
+        self._device = device
+        self._merged = merged
+        self._callback = callback
+        self._output = None
+
+    def wait(self) -> torch.Tensor:
+        """wait
+        Make the current stream wait for the all-gather, then merge the shards.
+        It does not block the host, and calling it more than once is allowed.
+
+        Returns:
+            torch.Tensor: a replicated tensor.
+        """
+        if self._output is None:
+            self._work.wait()
+            if self._merged is None:
+                self._merged = DistSpecManager._merge_shards(self._buffer, self._old_dist_spec)
+            self._output = self._merged.to(self._device)
+            self._buffer = None
+            self._merged = None
+            if self._callback is not None:
+                self._callback(self._output)
+        return self._output
+
+
 class TransformDistSpec(torch.autograd.Function):
 
     @staticmethod
@@ -70,14 +123,16 @@ class DistSpecManager:
 
         chunk = tensor
         idx = pg.tp_local_rank()
-        num_parts = prod(dist_spec.num_partitions)
+        num_parts = reduce(operator.mul, dist_spec.num_partitions, 1)
         for i, dim in enumerate(dist_spec.dims):
             num_parts //= dist_spec.num_partitions[i]
 
             chunk_size = divide(tensor.size(dim), dist_spec.num_partitions[i])
             chunk = chunk.narrow(dim, idx // num_parts * chunk_size, chunk_size)
             idx %= num_parts
-        return chunk.clone().detach().contiguous()
+        # detach the view before copying so that the copy is not recorded by autograd,
+        # and copy straight into a contiguous buffer so that no second copy is needed
+        return chunk.detach().clone(memory_format=torch.contiguous_format)
 
     @staticmethod
     def _gather(tensor: torch.Tensor, old_dist_spec: _DistSpec, pg: ProcessGroup) -> torch.Tensor:
@@ -90,17 +145,113 @@ class DistSpecManager:
             torch.Tensor: a replicated tensor.
         """
         assert old_dist_spec.placement.value == 's', f"The old_dist_spec of DistSpecManager._gather must be SHARD!"
-        is_cpu_tensor = False
-        if tensor.device.type == 'cpu':
-            # pytorch lower than 1.11 dose not support gather a cpu tensor.
-            # Therefore, we transfer tensor to GPU before gather.
-            saved_dev = tensor.device
-            tensor.data = tensor.data.cuda()
-            is_cpu_tensor = True
+        saved_dev = tensor.device
+        tensor = DistSpecManager._to_gather_device(tensor)
+        _, buffer, output = DistSpecManager._all_gather(tensor, old_dist_spec, pg)
+        if output is None:
+            output = DistSpecManager._merge_shards(buffer, old_dist_spec)
+
+        if output.device != saved_dev:
+            output.data = output.data.to(saved_dev)
+        return output
+
+    @staticmethod
+    def _to_gather_device(tensor: torch.Tensor) -> torch.Tensor:
+        """_to_gather_device returns the tensor on a device it can be gathered from.
+        Pytorch lower than 1.11 does not support gathering a cpu tensor,
+        therefore, a cpu tensor is transferred to GPU before gather.
+        Args:
+            tensor (torch.Tensor): a torch tensor to be gathered.
 
-        buffer = [torch.empty_like(tensor) for _ in range(pg.tp_world_size())]
+        Returns:
+            torch.Tensor: a cuda tensor.
+        """
+        if tensor.device.type == 'cpu':
+            tensor = tensor.cuda()
         assert tensor.device.type == 'cuda'
-        dist.all_gather(buffer, tensor, group=pg.tp_process_group())
+        return tensor
+
+    @staticmethod
+    def _gather_async(tensor: torch.Tensor,
+                      old_dist_spec: _DistSpec,
+                      pg: ProcessGroup,
+                      callback: Optional[Callable[[torch.Tensor], None]] = None) -> AsyncGatherHandle:
+        """_gather_async launches the all-gather of a sharded tensor without waiting for it.
+        Args:
+            tensor (torch.Tensor): a shared torch tensor
+            old_dist_spec (_DistSpec): the distributed spec. of the tensor.
+            pg (ProcessGroup): the process group of the corresponding colotensor
+            callback (Optional[Callable[[torch.Tensor], None]], optional): called with the replicated tensor
+                when the handle is waited. Defaults to None.
+
+        Returns:
+            AsyncGatherHandle: a handle whose `wait()` returns the replicated tensor.
+        """
+        assert old_dist_spec.placement.value == 's', \
+            "The old_dist_spec of DistSpecManager._gather_async must be SHARD!"
+        saved_dev = tensor.device
+        tensor = DistSpecManager._to_gather_device(tensor)
+        work, buffer, merged = DistSpecManager._all_gather(tensor, old_dist_spec, pg, async_op=True)
+        return AsyncGatherHandle(work, buffer, old_dist_spec, saved_dev, merged, callback)
+
+    @staticmethod
+    def _all_gather(tensor: torch.Tensor,
+                    old_dist_spec: _DistSpec,
+                    pg: ProcessGroup,
+                    async_op: bool = False) -> Tuple[Any, Optional[List[torch.Tensor]], Optional[torch.Tensor]]:
+        """_all_gather gathers the shards of all ranks.
+        When the tensor is only sharded along the first dimension, the shards are laid out back to back
+        in the replicated tensor, so they are gathered straight into it with `all_gather_into_tensor`.
+        Otherwise they are gathered into views of a single allocation and still have to be merged.
+        Args:
+            tensor (torch.Tensor): a shared cuda tensor
+            old_dist_spec (_DistSpec): the distributed spec. of the tensor.
+            pg (ProcessGroup): the process group of the corresponding colotensor
+            async_op (bool, optional): whether to launch the all-gather asynchronously. Defaults to False.
+
+        Returns:
+            Tuple[Any, Optional[List[torch.Tensor]], Optional[torch.Tensor]]: the async work (None if not `async_op`),
+                and either the buffers of all ranks to be merged or the replicated tensor.
+        """
+        # imported here, as colossalai.communication depends on colossalai.context, which imports colossalai.tensor
+        from colossalai.communication.collective import _all_gather_func
+
+        world_size = pg.tp_world_size()
+        # use the shape rather than size(), which returns the global size for a ColoTensor
+        shape = tuple(tensor.shape)
+        output = torch.empty((world_size * shape[0],) + shape[1:], dtype=tensor.dtype, device=tensor.device)
+        if DistSpecManager._is_gathered_in_place(shape, old_dist_spec, world_size):
+            work = _all_gather_func(output, tensor, group=pg.tp_process_group(), async_op=async_op)
+            return work, None, output
+        buffer = list(output.view((world_size,) + shape).unbind(0))
+        work = dist.all_gather(buffer, tensor, group=pg.tp_process_group(), async_op=async_op)
+        return work, buffer, None
+
+    @staticmethod
+    def _is_gathered_in_place(shape: Tuple[int, ...], old_dist_spec: _DistSpec, world_size: int) -> bool:
+        """_is_gathered_in_place checks whether the shards of all ranks are laid out back to back
+        in the replicated tensor, which holds when the tensor is only sharded along the first dimension.
+        Args:
+            shape (Tuple[int, ...]): the local shape of the shard.
+            old_dist_spec (_DistSpec): the distributed spec. of the tensor.
+            world_size (int): the tp world size.
+
+        Returns:
+            bool: whether the shards can be gathered straight into the replicated tensor.
+        """
+        return len(old_dist_spec.dims) == 1 and old_dist_spec.dims[0] % len(shape) == 0 \
+            and old_dist_spec.num_partitions[0] == world_size
+
+    @staticmethod
+    def _merge_shards(buffer: List[torch.Tensor], old_dist_spec: _DistSpec) -> torch.Tensor:
+        """_merge_shards concatenates the shards of all ranks into a replicated tensor.
+        Args:
+            buffer (List[torch.Tensor]): the shards ordered by the tp local rank.
+            old_dist_spec (_DistSpec): the distributed spec. of the shards.
+
+        Returns:
+            torch.Tensor: a replicated tensor.
+        """
         for i in range(len(old_dist_spec.dims) - 1, -1, -1):
             new_buffer = []
             dim = old_dist_spec.dims[i]
@@ -109,11 +260,37 @@ class DistSpecManager:
                 new_buffer.append(torch.cat(buffer[start:start + num_parts], dim))
             buffer = new_buffer
         assert len(buffer) == 1
-
-        if is_cpu_tensor:
-            buffer[0].data = buffer[0].data.to(saved_dev)
         return buffer[0]
 
+    @staticmethod
+    def _gather_bucketed(tensors: List[torch.Tensor], old_dist_spec: _DistSpec, pg: ProcessGroup) -> List[torch.Tensor]:
+        """_gather_bucketed gathers a list of sharded tensors with a single all-gather.
+        The shards are flattened into one buffer, so that small tensors do not pay a collective each.
+        Args:
+            tensors (List[torch.Tensor]): sharded tensors with the same dtype and device.
+            old_dist_spec (_DistSpec): the distributed spec. shared by all the tensors.
+            pg (ProcessGroup): the process group shared by all the tensors.
+
+        Returns:
+            List[torch.Tensor]: the replicated tensors, in the same order as `tensors`.
+        """
+        assert old_dist_spec.placement.value == 's', \
+            "The old_dist_spec of DistSpecManager._gather_bucketed must be SHARD!"
+        saved_dev = tensors[0].device
+        flat = DistSpecManager._to_gather_device(torch.cat([t.reshape(-1) for t in tensors]))
+
+        buffer = list(flat.new_empty((pg.tp_world_size(), flat.numel())).unbind(0))
+        dist.all_gather(buffer, flat, group=pg.tp_process_group())
+
+        outputs = []
+        offset = 0
+        for t in tensors:
+            numel = t.numel()
+            shards = [rank_flat[offset:offset + numel].view(t.shape) for rank_flat in buffer]
+            outputs.append(DistSpecManager._merge_shards(shards, old_dist_spec).to(saved_dev))
+            offset += numel
+        return outputs
+
     @staticmethod
     def _all_to_all(tensor: torch.Tensor, old_dist_spec: _DistSpec, dist_spec: _DistSpec,
                     pg: ProcessGroup) -> torch.Tensor:
@@ -94,18 +94,23 @@ class ProcessGroup:
 
         self._tp_rank_list = None
         self._dp_rank_list = None
+        # keep the pytorch groups of the current rank, so that collectives do not look them up every time
+        self._tp_process_group = None
+        self._dp_process_group = None
 
         for i in range(self._dp_degree):
             i_tp_list = [self._rank_list[i * self._tp_degree + j] for j in range(self._tp_degree)]
-            PYTORCHPGDICT_.get(i_tp_list, 'nccl')
+            i_tp_group = PYTORCHPGDICT_.get(i_tp_list, 'nccl')
             if self._rank in i_tp_list:
                 self._tp_rank_list = i_tp_list
+                self._tp_process_group = i_tp_group
 
         for j in range(self._tp_degree):
             j_dp_list = [self._rank_list[i * self._tp_degree + j] for i in range(self._dp_degree)]
-            PYTORCHPGDICT_.get(j_dp_list, 'nccl')
+            j_dp_group = PYTORCHPGDICT_.get(j_dp_list, 'nccl')
             if self._rank in j_dp_list:
                 self._dp_rank_list = j_dp_list
+                self._dp_process_group = j_dp_group
 
         self._has_cpu_groups = False
         self.is_init = True
@@ -260,7 +265,7 @@ class ProcessGroup:
         Returns:
             `torch._C._distributed_c10d.ProcessGroup`: the pytorch DP process group.
         """
-        return PYTORCHPGDICT_.get(self._dp_rank_list, 'nccl')
+        return self._dp_process_group
 
     def tp_process_group(self):
         """tp_process_group
@@ -270,7 +275,7 @@ class ProcessGroup:
         Returns:
             `torch._C._distributed_c10d.ProcessGroup`: the pytorch TP process group.
         """
-        return PYTORCHPGDICT_.get(self._tp_rank_list, 'nccl')
+        return self._tp_process_group
 
     def cpu_dp_process_group(self):
         """cpu_dp_process_group
@@ -122,6 +122,68 @@ def _run_redistributed(world_size):
     assert t1.is_replicate()
 
 
+def _run_to_replicate_row_shard(world_size):
+    pg = ProcessGroup(tp_degree=world_size)
+    t_ref = torch.arange(4 * world_size * 5).float().view(4 * world_size, 5)
+    t = ColoTensor.from_torch_tensor(t_ref.clone(), ColoTensorSpec(pg))
+    t = t.redistribute(ShardSpec([0], [pg.tp_world_size()]))
+    assert t.is_shard_1drow()
+    t = t.to_replicate()
+    assert t.is_replicate()
+    assert torch.equal(t, t_ref)
+
+
+def _run_size_global(world_size):
+    pg = ProcessGroup(tp_degree=world_size)
+    t_ref = torch.randn(4 * world_size, 6 * world_size)
+    for shard_dim in [0, 1]:
+        t = ColoTensor.from_torch_tensor(t_ref.clone(), ColoTensorSpec(pg))
+        t.set_dist_spec(ShardSpec([shard_dim], [pg.tp_world_size()]))
+        assert t.size_global() == t_ref.size()
+        assert t.size_global(0) == 4 * world_size
+        assert t.size_global(-1) == 6 * world_size
+        assert t.size(0) == 4 * world_size
+        assert t.size(-1) == 6 * world_size
+
+
+def _run_replicate_bucketed(world_size):
+    pg = ProcessGroup(tp_degree=world_size)
+    t_refs = [torch.arange(4 * world_size * 5).float().view(4 * world_size, 5), torch.arange(3 * world_size).float()]
+    # one bucket holding both tensors, then every tensor flushed on its own
+    for bucket_size_mb in [25, 0]:
+        tensors = [ColoTensor.from_torch_tensor(t_ref.clone(), ColoTensorSpec(pg)) for t_ref in t_refs]
+        for t in tensors:
+            t.set_dist_spec(ShardSpec([0], [pg.tp_world_size()]))
+        ColoTensor.to_replicate_bucketed_(tensors, bucket_size_mb=bucket_size_mb)
+        for t, t_ref in zip(tensors, t_refs):
+            assert t.is_replicate()
+            assert torch.equal(t, t_ref)
+
+
+def _run_replicate_async(world_size):
+    pg = ProcessGroup(tp_degree=world_size)
+    t_ref = torch.arange(4 * world_size * 5).float().view(4 * world_size, 5)
+    t = ColoTensor.from_torch_tensor(t_ref.clone(), ColoTensorSpec(pg))
+    t.set_dist_spec(ShardSpec([-1], [pg.tp_world_size()]))
+    handle = t.to_replicate_async_()
+    handle.wait()
+    assert t.is_replicate()
+    assert torch.equal(t, t_ref)
+
+
+def _run_bypass_unsharded_outputs(world_size):
+    pg = ProcessGroup(tp_degree=world_size)
+    t_ref = torch.randn(4 * world_size, 5)
+    replicated = ColoTensor.from_torch_tensor(t_ref.clone(), ColoTensorSpec(pg))
+    sharded = ColoTensor.from_torch_tensor(t_ref.clone(), ColoTensorSpec(pg))
+    sharded.set_dist_spec(ShardSpec([0], [pg.tp_world_size()]))
+    with ColoTensor.bypass_unsharded_outputs():
+        t_abs = replicated.abs()
+        assert type(t_abs) is torch.Tensor and torch.equal(t_abs, t_ref.abs())
+        assert isinstance(sharded.abs(), ColoTensor)
+    assert isinstance(replicated.abs(), ColoTensor)
+
+
 def _run_set_tensor_spec(world_size):
     if world_size != 4:
         return
@@ -145,6 +207,11 @@ def run_dist_tests(rank, world_size, port):
     _run_operand(world_size)
     _run_wrapped_tensor_func()
     _run_redistributed(world_size)
+    _run_to_replicate_row_shard(world_size)
+    _run_size_global(world_size)
+    _run_replicate_bucketed(world_size)
+    _run_replicate_async(world_size)
+    _run_bypass_unsharded_outputs(world_size)
     _run_set_tensor_spec(world_size)
 
 